@@ -13,15 +13,108 @@ Git History Analysis Script for Copilot Instructions
 5. 在控制台输出分析结果
 """
 
+import shutil
 import subprocess
-import json
 import os
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+
+# orjson的解析/序列化比标准库json快数倍，可用时优先使用
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+# 热路径中的常量元组提升到模块级，避免每次调用重建
+_RENAME_STATUSES = ('R', 'C')
+_TEST_PREFIXES = ('test/', 'tests/')
+
+# Git状态首字母 → 可读的操作描述
+_ACTION_MAP = {
+    'A': '新增',
+    'M': '修改',
+    'D': '删除',
+    'R': '重命名',
+    'C': '复制',
+}
+
+def _handle_simple_status(parts: List[str]) -> Dict[str, str]:
+    """构造A/M/D等单路径状态行的文件变更记录"""
+    status = parts[0]
+    return {
+        'status': status,
+        'path': parts[1],
+        'action': _ACTION_MAP.get(status[:1], '变更')
+    }
+
+def _handle_rename_status(parts: List[str]) -> Dict[str, str]:
+    """构造R/C状态行的文件变更记录（含旧/新路径）"""
+    if len(parts) != 3:
+        return _handle_simple_status(parts)
+    status = parts[0]
+    return {
+        'status': status,
+        'path': parts[2],
+        'old_path': parts[1],
+        'action': _ACTION_MAP.get(status[:1], '变更')
+    }
+
+# 预绑定的format方法：循环体内不再反复解析f-string的格式程序
+_COMMIT_BLOCK = (
+    "- **{msg}** ({sha})\n"
+    "  - 作者: {author}\n"
+    "  - 时间: {date}\n"
+    "  - 影响: {impact}"
+).format
+
+_COMMIT_DETAIL = (
+    "### {index}. {msg}\n"
+    "\n"
+    "- **提交hash**: `{sha}`\n"
+    "- **作者**: {author} <{email}>\n"
+    "- **时间**: {date}\n"
+    "- **影响范围**: {impact}"
+).format
+
+# 按状态首字母查表分发，取代逐行的startswith/长度分支链
+_STATUS_HANDLERS = {
+    'A': _handle_simple_status,
+    'M': _handle_simple_status,
+    'D': _handle_simple_status,
+    'R': _handle_rename_status,
+    'C': _handle_rename_status,
+}
 
 class GitCommitAnalyzer:
+    # 扩展名（小写、不含点）→ 类别：一次哈希查找替代逐分支的endswith扫描
+    EXT_TO_CATEGORY = {
+        'py': '源代码', 'js': '源代码', 'ts': '源代码', 'java': '源代码',
+        'cs': '源代码', 'cpp': '源代码', 'c': '源代码', 'h': '源代码',
+        'md': '文档', 'txt': '文档', 'rst': '文档', 'adoc': '文档',
+        'json': '配置文件', 'yaml': '配置文件', 'yml': '配置文件',
+        'xml': '配置文件', 'ini': '配置文件', 'toml': '配置文件',
+        'html': '前端资源', 'css': '前端资源', 'scss': '前端资源',
+        'less': '前端资源',
+        'sql': '数据库', 'db': '数据库',
+        'sh': '脚本文件', 'bat': '脚本文件', 'ps1': '脚本文件',
+        'proto': '协议定义', 'thrift': '协议定义',
+    }
+
+    # 特殊文件名 → 类别（优先于扩展名判断）
+    SPECIAL_PATHS = {
+        'README.md': '项目文档',
+        'LICENSE': '项目文档',
+        'CHANGELOG.md': '项目文档',
+        'CONTRIBUTING.md': '项目文档',
+    }
+
     def __init__(self, repo_path: str = "."):
         """初始化Git提交分析器
 
@@ -29,18 +122,27 @@ class GitCommitAnalyzer:
             repo_path: Git仓库路径，默认为当前目录
         """
         self.repo_path = Path(repo_path)
+        # 解析一次git可执行文件路径，省去每次调用的PATH查找
+        self._git = shutil.which("git") or "git"
         self.metadata_file = self.repo_path / ".github" / "copilot-instructions.metadata.json"
         self.copilot_instructions_file = self.repo_path / ".github" / "copilot-instructions.md"
+        self.summary_cache_file = self.repo_path / ".github" / "copilot-instructions.summary.md"
+        # 每个线程一个常驻的`git cat-file --batch`协进程（按需启动）
+        self._catfile_local = threading.local()
+        # 当前一轮分析中按类别分组的提交，由analyze_commit_impact边分析边填充
+        self._by_category: Dict[str, List[Dict[str, Any]]] = {}
+        # (提交hash, 文件路径) → diff文本，同一报告反复渲染时不重复调git
+        self._diff_cache: Dict[Tuple[str, str], str] = {}
 
     def load_metadata(self) -> Optional[Dict[str, Any]]:
         """加载copilot-instructions的元数据（如果可用）"""
         try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(self.metadata_file.read_bytes())
         except FileNotFoundError:
             print(f"提示：找不到元数据文件 {self.metadata_file}，将使用默认设置")
             return None
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # orjson.JSONDecodeError和json.JSONDecodeError都是ValueError子类
             print(f"警告：解析JSON文件失败 - {e}，将使用默认设置")
             return None
         except Exception as e:
@@ -48,55 +150,75 @@ class GitCommitAnalyzer:
             return None
 
     def run_git_command(self, command: List[str]) -> str:
-        """运行git命令并返回输出"""
+        """运行git命令并返回输出
+
+        捕获原始字节后整段解码一次；对大输出（如git log -p）比
+        text=True经由TextIOWrapper的增量解码开销更低。
+        """
+        return self.run_git_command_bytes(command).decode('utf-8', 'ignore').strip()
+
+    def run_git_command_bytes(self, command: List[str]) -> bytes:
+        """运行git命令并返回原始字节输出（供按NUL分隔解析的调用方使用）"""
         try:
             result = subprocess.run(
-                ["git"] + command,
+                [self._git, *command],
                 cwd=self.repo_path,
                 capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='ignore',  # 忽略编码错误
-                check=True
+                check=True,
+                close_fds=False
             )
-            return result.stdout.strip()
+            return result.stdout
         except subprocess.CalledProcessError as e:
             print(f"Git命令执行失败: {' '.join(command)}")
-            print(f"错误输出: {e.stderr}")
-            return ""
+            print(f"错误输出: {e.stderr.decode('utf-8', 'ignore')}")
+            return b""
         except Exception as e:
             print(f"运行Git命令时出现异常: {e}")
-            return ""
+            return b""
 
-    def get_commits_since(self, start_commit: str) -> List[Dict[str, Any]]:
-        """获取从指定提交以来的所有提交记录（健壮解析）
+    # 提交对象不允许包含NUL字节，用%x00做字段分隔符不会和内容冲突
+    _LOG_FORMAT_NUL = "%H%x00%an%x00%ae%x00%ai%x00%s%x00%b%x00"
 
-        使用字段分隔符解析，避免JSON格式在换行/转义上的脆弱性。
-        字段分隔符: 0x1F，记录分隔符: 0x1E。
-        """
-        format_str = "%H%x1f%an%x1f%ae%x1f%ai%x1f%s%x1f%b%x1e"
+    def _log_commits(self, log_args: List[str]) -> List[Dict[str, Any]]:
+        """批量获取提交记录（NUL分隔、字节级解析）
+
+        以0x00做字段分隔符比0x1F/0x1E更稳健——提交消息里可以出现
+        0x1F/0x1E，但git禁止提交对象包含NUL。在原始字节流上按
+        每6个字段一组用索引指针遍历，逐字段做一次UTF-8解码。
+
+        Args:
+            log_args: 传给git log的范围/数量参数
 
-        commits_output = self.run_git_command([
+        Returns:
+            提交信息列表，顺序与git log一致
+        """
+        raw = self.run_git_command_bytes([
             "log",
-            f"{start_commit}..HEAD",
-            f"--pretty=format:{format_str}",
+            *log_args,
+            f"--pretty=format:{self._LOG_FORMAT_NUL}",
             "--no-merges",
             "--encoding=UTF-8",
         ])
 
-        if not commits_output:
+        if not raw:
             return []
 
-        records = commits_output.strip("\n\x1e").split("\x1e")
         commits: List[Dict[str, Any]] = []
-        for rec in records:
-            if not rec:
-                continue
-            parts = rec.split("\x1f")
-            if len(parts) < 5:
-                continue
-            hash_, author, email, date, subject = (part.strip() for part in parts[:5])
-            body = parts[5].strip() if len(parts) > 5 else ""
+        pos, size = 0, len(raw)
+        while pos < size:
+            fields = []
+            for _ in range(6):
+                end = raw.find(b'\x00', pos)
+                if end == -1:
+                    break
+                fields.append(raw[pos:end])
+                pos = end + 1
+            if len(fields) < 6:
+                break
+            # 记录之间git会插入换行，strip()一并去掉
+            hash_, author, email, date, subject, body = (
+                field.decode('utf-8', 'ignore').strip() for field in fields
+            )
             commits.append({
                 "hash": hash_,
                 "author": author,
@@ -108,6 +230,10 @@ class GitCommitAnalyzer:
 
         return commits
 
+    def get_commits_since(self, start_commit: str) -> List[Dict[str, Any]]:
+        """获取从指定提交以来的所有提交记录（健壮解析）"""
+        return self._log_commits([f"{start_commit}..HEAD"])
+
     def get_commit_files(self, commit_hash: str) -> List[Dict[str, str]]:
         """获取指定提交涉及的文件变更
 
@@ -125,47 +251,222 @@ class GitCommitAnalyzer:
         ])
 
         files = []
-        for line in files_output.split('\n'):
-            if line.strip():
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    status = parts[0]
-                    # R 或 C 重命名/复制会包含旧/新路径
-                    if status.startswith(('R', 'C')) and len(parts) == 3:
-                        old_path, new_path = parts[1], parts[2]
-                        files.append({
-                            'status': status,
-                            'path': new_path,
-                            'old_path': old_path,
-                            'action': self._get_action_description(status)
-                        })
-                    else:
-                        filepath = parts[1]
-                        files.append({
-                            'status': status,
-                            'path': filepath,
-                            'action': self._get_action_description(status)
-                        })
+        # splitlines+filter惰性跳过空行，避免为整份输出物化中间列表
+        for line in filter(None, map(str.strip, files_output.splitlines())):
+            file_info = self._parse_name_status_line(line)
+            if file_info:
+                files.append(file_info)
 
         return files
 
-    def _get_action_description(self, status: str) -> str:
-        """将Git状态转换为可读的操作描述"""
-        status_map = {
-            'A': '新增',
-            'M': '修改',
-            'D': '删除',
-            'R': '重命名',
-            'C': '复制'
+    def _parse_name_status_line(self, line: str) -> Optional[Dict[str, str]]:
+        """解析一行`--name-status`输出为文件变更记录
+
+        Args:
+            line: 形如"M\\tpath"或"R100\\told\\tnew"的状态行
+
+        Returns:
+            文件变更字典，无法解析时返回None
+        """
+        parts = line.split('\t')
+        if len(parts) < 2:
+            return None
+        # 未知状态按单路径处理，与旧的分支链行为一致
+        handler = _STATUS_HANDLERS.get(line[0], _handle_simple_status)
+        return handler(parts)
+
+    def get_commits_with_files(
+        self,
+        start_commit: Optional[str] = None,
+        max_commits: Optional[int] = None,
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, str]]]]:
+        """单次git调用流式生成提交记录及其文件变更
+
+        以前的流程先取提交列表，再对每个提交调用`git show --name-status`，
+        N个提交需要N+1次fork/exec；这里用一次`git log --name-status`在
+        同一条输出流上逐行解析提交元数据和文件状态，消除逐提交的
+        子进程开销。记录随git输出逐条产出，不在内存中积攒完整列表，
+        峰值内存与提交数量无关。
+
+        记录以0x1E开头，提交字段以0x1F分隔（最后一个0x1F终结body，
+        避免body的换行与后续的文件状态行混淆）。
+
+        Args:
+            start_commit: 起始提交hash，指定时分析start_commit..HEAD
+            max_commits: 最大提交数量（start_commit未指定时生效）
+
+        Yields:
+            (提交信息, 文件变更列表) 元组，顺序与git log一致
+        """
+        format_str = "%x1e%H%x1f%an%x1f%ae%x1f%ai%x1f%s%x1f%b%x1f"
+
+        command = [self._git, "log"]
+        if start_commit:
+            command.append(f"{start_commit}..HEAD")
+        elif max_commits:
+            command.append(f"-{max_commits}")
+        command.extend([
+            f"--pretty=format:{format_str}",
+            "--no-merges",
+            "--name-status",
+            "--encoding=UTF-8",
+        ])
+
+        try:
+            process = subprocess.Popen(
+                command,
+                cwd=self.repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',
+                errors='ignore',
+            )
+        except Exception as e:
+            print(f"运行Git命令时出现异常: {e}")
+            return
+
+        record_lines: List[str] = []
+
+        assert process.stdout is not None
+        for line in process.stdout:
+            line = line.rstrip('\n')
+            if line.startswith('\x1e'):
+                # 新记录开始，先产出上一条
+                if record_lines:
+                    parsed = self._parse_log_record('\n'.join(record_lines))
+                    if parsed:
+                        yield parsed
+                record_lines = [line[1:]]
+            else:
+                record_lines.append(line)
+        if record_lines:
+            parsed = self._parse_log_record('\n'.join(record_lines))
+            if parsed:
+                yield parsed
+
+        process.stdout.close()
+        stderr_output = process.stderr.read() if process.stderr else ""
+        if process.wait() != 0:
+            print(f"Git命令执行失败: {' '.join(command[1:])}")
+            print(f"错误输出: {stderr_output}")
+
+    def _parse_log_record(
+        self, record: str
+    ) -> Optional[Tuple[Dict[str, Any], List[Dict[str, str]]]]:
+        """解析单条git log记录（提交字段 + name-status块）"""
+        parts = record.split('\x1f')
+        if len(parts) < 6:
+            return None
+
+        hash_, author, email, date, subject = (part.strip() for part in parts[:5])
+        body = parts[5].strip()
+        commit = {
+            "hash": hash_,
+            "author": author,
+            "email": email,
+            "date": date,
+            "message": subject,
+            "body": body,
         }
-        return status_map.get(status[0], '变更')
+
+        files: List[Dict[str, str]] = []
+        # 最后一个0x1F之后是该提交的name-status行
+        if len(parts) > 6:
+            for line in filter(None, map(str.strip, parts[6].splitlines())):
+                file_info = self._parse_name_status_line(line)
+                if file_info:
+                    files.append(file_info)
+
+        return commit, files
+
+    def _get_action_description(self, status: str) -> str:
+        """将Git状态转换为可读的操作描述（兼容保留，查表见_ACTION_MAP）"""
+        return _ACTION_MAP.get(status[:1], '变更')
+
+    def _get_catfile_process(self) -> subprocess.Popen:
+        """获取当前线程的`git cat-file --batch`常驻进程（按需启动）
+
+        每次`git show <commit>:<path>`都要fork/exec一个新进程；
+        常驻的batch进程通过stdin/stdout应答任意多次请求，
+        把N次进程启动开销降为每线程1次。
+        """
+        process = getattr(self._catfile_local, 'process', None)
+        if process is None or process.poll() is not None:
+            process = subprocess.Popen(
+                [self._git, "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self._catfile_local.process = process
+        return process
+
+    def get_file_content(self, commit_hash: str, filepath: str) -> str:
+        """获取指定提交中某个文件的完整内容
+
+        等价于`git show <commit>:<path>`，但复用常驻的
+        `git cat-file --batch`协进程，避免逐文件的子进程开销。
+
+        Args:
+            commit_hash: 提交hash
+            filepath: 文件路径
+
+        Returns:
+            文件内容，对象不存在或读取失败时返回空字符串
+        """
+        try:
+            process = self._get_catfile_process()
+            assert process.stdin is not None and process.stdout is not None
+            process.stdin.write(f"{commit_hash}:{filepath}\n".encode('utf-8'))
+            process.stdin.flush()
+
+            header = process.stdout.readline()
+            if not header or header.rstrip().endswith((b'missing', b'ambiguous')):
+                return ""
+            # 应答头格式: <sha> <type> <size>\n
+            size = int(header.split()[2])
+            content = process.stdout.read(size)
+            process.stdout.read(1)  # 内容后的终止换行符
+            return content.decode('utf-8', 'ignore')
+        except Exception as e:
+            print(f"读取文件内容失败 {commit_hash}:{filepath} - {e}")
+            return ""
+
+    def close(self) -> None:
+        """关闭当前线程持有的git协进程"""
+        process = getattr(self._catfile_local, 'process', None)
+        if process is not None:
+            self._catfile_local.process = None
+            try:
+                if process.stdin:
+                    process.stdin.close()
+                process.terminate()
+                process.wait(timeout=5)
+            except Exception:
+                pass
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def get_file_diff(self, commit_hash: str, filepath: str) -> str:
         """获取指定提交中某个文件的diff
 
         使用 `git show <commit> -- <path>` 查看该提交相对父提交的差异。
-        若需要文件内容可改用 `git show <commit>:<path>`。
+        若需要文件内容可改用 `get_file_content`（走常驻协进程）。
+
+        结果按(commit_hash, filepath)缓存在实例上——`git show`要物化
+        完整补丁文本，是单次开销最大的git调用，重复请求直接命中缓存。
         """
+        cache_key = (commit_hash, filepath)
+        cached = self._diff_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         diff_output = self.run_git_command([
             "show",
             "--no-color",
@@ -173,8 +474,47 @@ class GitCommitAnalyzer:
             "--",
             filepath
         ])
+        self._diff_cache[cache_key] = diff_output
         return diff_output
 
+    def _classify_filepath(self, filepath: str) -> List[str]:
+        """通用文件类型分类（不依赖特定项目结构）
+
+        先匹配特殊文件名和路径前缀，再按小写扩展名做一次字典查找，
+        每个文件的分类成本是常数次哈希查找而非遍历整个分支链。
+
+        Args:
+            filepath: 相对仓库根的文件路径
+
+        Returns:
+            类别列表（通常一个，.github/copilot-instructions.md为两个）
+        """
+        name = os.path.basename(filepath)
+
+        category = self.SPECIAL_PATHS.get(name)
+        if category is not None:
+            return [category]
+
+        if filepath.startswith('.github/'):
+            categories = ['CI/CD配置']
+            if filepath == '.github/copilot-instructions.md':
+                categories.append('AI 指南')
+            return categories
+
+        if filepath.startswith(_TEST_PREFIXES):
+            return ['测试文件']
+
+        ext = name.rpartition('.')[2].lower()
+        category = self.EXT_TO_CATEGORY.get(ext)
+        if category is not None:
+            return [category]
+
+        if 'test' in filepath.lower():
+            return ['测试文件']
+        if '.' not in name:
+            return ['可执行文件']
+        return ['其他文件']
+
     def analyze_commit_impact(self, commit: Dict[str, Any], files: List[Dict[str, str]]) -> Dict[str, Any]:
         """分析单个提交的影响
 
@@ -190,11 +530,14 @@ class GitCommitAnalyzer:
             'files': files,
             'categories': [],
             'impact_summary': '',
-            'key_changes': []
+            'key_changes': [],
+            # 摘要渲染中多处使用短hash，这里切片一次
+            'short_hash': commit['hash'][:8],
         }
 
         # 分析文件类型和影响范围
-        categories = set()
+        # 用保序dict当set用：去重的同时保证类别输出顺序可复现
+        categories: Dict[str, None] = {}
         key_changes = []
 
         for file_info in files:
@@ -203,37 +546,13 @@ class GitCommitAnalyzer:
             action = file_info['action']
 
             # 通用文件类型分类（不依赖特定项目结构）
-            if filepath.endswith(('.py', '.js', '.ts', '.java', '.cs', '.cpp', '.c', '.h')):
-                categories.add('源代码')
-            elif filepath.endswith(('.md', '.txt', '.rst', '.adoc')):
-                categories.add('文档')
-            elif filepath.endswith(('.json', '.yaml', '.yml', '.xml', '.ini', '.toml')):
-                categories.add('配置文件')
-            elif filepath.endswith(('.html', '.css', '.scss', '.less')):
-                categories.add('前端资源')
-            elif filepath.endswith(('.sql', '.db')):
-                categories.add('数据库')
-            elif filepath.endswith(('.sh', '.bat', '.ps1')):
-                categories.add('脚本文件')
-            elif filepath.endswith(('.proto', '.thrift')):
-                categories.add('协议定义')
-            elif filepath.startswith('.github/'):
-                categories.add('CI/CD配置')
-                if filepath == '.github/copilot-instructions.md':
-                    categories.add('AI 指南')
-            elif filepath.startswith('test/') or filepath.startswith('tests/') or 'test' in filepath.lower():
-                categories.add('测试文件')
-            elif filepath in ['README.md', 'LICENSE', 'CHANGELOG.md', 'CONTRIBUTING.md']:
-                categories.add('项目文档')
-            elif '.' not in os.path.basename(filepath):
-                categories.add('可执行文件')
-            else:
-                categories.add('其他文件')
+            for category in self._classify_filepath(filepath):
+                categories[category] = None
 
             # 生成关键变更描述
             if status in ['A', 'M', 'D']:
                 key_changes.append(f"{action} {filepath}")
-            elif status.startswith(('R', 'C')):
+            elif status.startswith(_RENAME_STATUSES):
                 old_path = file_info.get('old_path')
                 if old_path and old_path != filepath:
                     key_changes.append(f"{action} {old_path} → {filepath}")
@@ -243,6 +562,10 @@ class GitCommitAnalyzer:
         analysis['categories'] = list(categories)
         analysis['key_changes'] = key_changes
 
+        # 顺手维护按类别分组的索引，省去categorize_changes的二次遍历
+        for category in categories:
+            self._by_category.setdefault(category, []).append(analysis)
+
         # 生成影响摘要
         impact_parts = []
         if categories:
@@ -254,60 +577,9 @@ class GitCommitAnalyzer:
 
         return analysis
 
-    def categorize_changes(self, analyses: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """将提交分析结果按类别分组
-
-        Args:
-            analyses: 提交分析结果列表
-
-        Returns:
-            按类别分组的变更
-        """
-        categorized = {}
-
-        for analysis in analyses:
-            for category in analysis['categories']:
-                if category not in categorized:
-                    categorized[category] = []
-                categorized[category].append(analysis)
-
-        return categorized
-
     def get_all_commits(self, max_commits: int = 50) -> List[Dict[str, Any]]:
         """获取所有提交记录（限制数量，健壮解析）"""
-        format_str = "%H%x1f%an%x1f%ae%x1f%ai%x1f%s%x1f%b%x1e"
-
-        commits_output = self.run_git_command([
-            "log",
-            f"-{max_commits}",
-            f"--pretty=format:{format_str}",
-            "--no-merges",
-            "--encoding=UTF-8",
-        ])
-
-        if not commits_output:
-            return []
-
-        records = commits_output.strip("\n\x1e").split("\x1e")
-        commits: List[Dict[str, Any]] = []
-        for rec in records:
-            if not rec:
-                continue
-            parts = rec.split("\x1f")
-            if len(parts) < 5:
-                continue
-            hash_, author, email, date, subject = (part.strip() for part in parts[:5])
-            body = parts[5].strip() if len(parts) > 5 else ""
-            commits.append({
-                "hash": hash_,
-                "author": author,
-                "email": email,
-                "date": date,
-                "message": subject,
-                "body": body,
-            })
-
-        return commits
+        return self._log_commits([f"-{max_commits}"])
 
     def generate_change_summary(self, analyses: List[Dict[str, Any]], start_commit: Optional[str] = None) -> str:
         """生成智能化的变更摘要
@@ -323,73 +595,75 @@ class GitCommitAnalyzer:
             return "没有找到提交记录。"
 
         summary_lines = [
-            f"# Git提交历史分析报告",
-            f"",
+            "# Git提交历史分析报告",
+            "",
             f"**分析时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             f"**提交数量**: {len(analyses)}",
         ]
+        # 绑定append避免逐行构造临时列表再extend
+        append = summary_lines.append
 
         if start_commit:
-            summary_lines.append(f"**起始提交**: {start_commit}")
+            append(f"**起始提交**: {start_commit}")
 
-        summary_lines.append("")
+        append("")
 
-        # 按类别分组
-        categorized = self.categorize_changes(analyses)
+        # 按类别分组的索引在analyze_commit_impact中已边分析边填充
+        categorized = self._by_category
 
         if categorized:
-            summary_lines.append("## 变更分类统计")
-            summary_lines.append("")
+            append("## 变更分类统计")
+            append("")
 
             for category, category_analyses in categorized.items():
-                summary_lines.append(f"### {category} ({len(category_analyses)}个提交)")
-                summary_lines.append("")
+                append(f"### {category} ({len(category_analyses)}个提交)")
+                append("")
 
                 for analysis in category_analyses[:3]:  # 只显示前3个，避免输出过长
                     commit = analysis['commit']
-                    summary_lines.append(f"- **{commit['message']}** ({commit['hash'][:8]})")
-                    summary_lines.append(f"  - 作者: {commit['author']}")
-                    summary_lines.append(f"  - 时间: {commit['date']}")
-                    summary_lines.append(f"  - 影响: {analysis['impact_summary']}")
-                    summary_lines.append("")
+                    append(_COMMIT_BLOCK(
+                        msg=commit['message'],
+                        sha=analysis['short_hash'],
+                        author=commit['author'],
+                        date=commit['date'],
+                        impact=analysis['impact_summary'],
+                    ))
+                    append("")
 
                 if len(category_analyses) > 3:
-                    summary_lines.append(f"  ... 还有 {len(category_analyses) - 3} 个提交")
-                    summary_lines.append("")
+                    append(f"  ... 还有 {len(category_analyses) - 3} 个提交")
+                    append("")
 
         # 添加详细的提交列表
-        summary_lines.extend([
-            "## 详细提交记录",
-            ""
-        ])
+        append("## 详细提交记录")
+        append("")
 
         for i, analysis in enumerate(analyses, 1):
             commit = analysis['commit']
-            summary_lines.extend([
-                f"### {i}. {commit['message']}",
-                f"",
-                f"- **提交hash**: `{commit['hash']}`",
-                f"- **作者**: {commit['author']} <{commit['email']}>",
-                f"- **时间**: {commit['date']}",
-                f"- **影响范围**: {analysis['impact_summary']}",
-                f""
-            ])
+            append(_COMMIT_DETAIL(
+                index=i,
+                msg=commit['message'],
+                sha=commit['hash'],
+                author=commit['author'],
+                email=commit['email'],
+                date=commit['date'],
+                impact=analysis['impact_summary'],
+            ))
+            append("")
 
             if commit['body'].strip():
-                summary_lines.extend([
-                    "**详细描述**:",
-                    "",
-                    commit['body'].strip(),
-                    ""
-                ])
+                append("**详细描述**:")
+                append("")
+                append(commit['body'].strip())
+                append("")
 
             if analysis['files']:
-                summary_lines.append("**变更文件**:")
-                summary_lines.append("")
+                append("**变更文件**:")
+                append("")
                 for file_info in analysis['files']:
-                    summary_lines.append(f"- {file_info['action']}: `{file_info['path']}`")
+                    append(f"- {file_info['action']}: `{file_info['path']}`")
 
-                summary_lines.append("")
+                append("")
 
         return '\n'.join(summary_lines)
 
@@ -403,11 +677,22 @@ class GitCommitAnalyzer:
         print("正在分析Git提交历史...")
 
         # 如果没有指定起始提交，尝试从元数据加载
+        metadata = None
         if start_commit is None:
             metadata = self.load_metadata()
             if metadata:
                 start_commit = metadata.get('range_start_commit')
 
+        # HEAD与元数据记录的上次更新一致时说明没有新提交，
+        # 直接复用缓存的摘要，跳过整个分析管线
+        if metadata:
+            last_commit = (metadata.get('last_update') or {}).get('commit')
+            if last_commit and self.summary_cache_file.exists():
+                head = self.run_git_command(["rev-parse", "HEAD"])
+                if head == last_commit:
+                    print("HEAD自上次更新以来没有变化，使用缓存的分析结果。")
+                    return self.summary_cache_file.read_text(encoding='utf-8')
+
         # 如果仍然没有起始提交，使用最近的一些提交
         if not start_commit:
             print("未找到起始提交，将分析最近的提交...")
@@ -425,29 +710,37 @@ class GitCommitAnalyzer:
 
         if start_commit:
             print(f"分析从提交 {start_commit} 以来的变更...")
-            # 获取提交列表
-            commits = self.get_commits_since(start_commit)
+            # 一次git调用流式获取提交列表及各自的文件变更
+            commits_with_files = self.get_commits_with_files(start_commit=start_commit)
         else:
             print("分析所有提交历史...")
             # 获取所有提交（限制数量）
-            commits = self.get_all_commits(max_commits)
-
-        if not commits:
-            print("没有找到提交记录。")
-            return "没有找到提交记录。"
+            commits_with_files = self.get_commits_with_files(max_commits=max_commits)
 
-        print(f"找到 {len(commits)} 个提交，正在分析...")
-
-        # 分析每个提交
+        # 边从git输出流读取边分析每个提交（重置上一轮的类别索引）
+        self._by_category = {}
         analyses = []
-        for commit in commits:
-            files = self.get_commit_files(commit['hash'])
+        for commit, files in commits_with_files:
             analysis = self.analyze_commit_impact(commit, files)
             analyses.append(analysis)
 
+        if not analyses:
+            print("没有找到提交记录。")
+            return "没有找到提交记录。"
+
+        print(f"找到 {len(analyses)} 个提交，分析完成，正在生成摘要...")
+
         # 生成摘要
         summary = self.generate_change_summary(analyses, start_commit)
 
+        # 缓存摘要，供HEAD未变化时的下次调用直接复用
+        if metadata:
+            try:
+                self.summary_cache_file.parent.mkdir(parents=True, exist_ok=True)
+                self.summary_cache_file.write_bytes(summary.encode('utf-8'))
+            except Exception as e:
+                print(f"警告：写入摘要缓存失败 - {e}")
+
         print("分析完成！")
         return summary
 
@@ -502,8 +795,8 @@ def main():
         if args.output:
             output_file = Path(args.output)
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(summary)
+            # 预编码后一次write写入，绕过文本模式编码器的分块
+            output_file.write_bytes(summary.encode('utf-8'))
             print(f"\n分析结果已保存到: {output_file}")
 
     except Exception as e:
@@ -11,14 +11,30 @@ Update Copilot Instructions Metadata Script
 3. 递增文档版本号
 """
 
+import shutil
 import subprocess
-import json
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# orjson的解析/序列化比标准库json快数倍，可用时优先使用
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class MetadataUpdater:
     def __init__(self, repo_path: str = "."):
@@ -28,19 +44,24 @@ class MetadataUpdater:
             repo_path: Git仓库路径，默认为当前目录
         """
         self.repo_path = Path(repo_path)
+        # 解析一次git可执行文件路径，省去每次调用的PATH查找
+        self._git = shutil.which("git") or "git"
         self.metadata_file = (
             self.repo_path / ".github" / "copilot-instructions.metadata.json"
         )
+        # 字符串形式缓存一次，传给git参数时不再逐次stringify
+        self._metadata_str = os.fspath(self.metadata_file)
 
     def run_git_command(self, command: list) -> str:
         """运行git命令并返回输出"""
         try:
             result = subprocess.run(
-                ["git"] + command,
+                [self._git, *command],
                 cwd=self.repo_path,
                 capture_output=True,
                 text=True,
                 check=True,
+                close_fds=False,  # 免去fork前扫描fd表，走posix_spawn快路径
             )
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
@@ -68,9 +89,9 @@ class MetadataUpdater:
         """加载现有的元数据文件"""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, "r", encoding="utf-8") as f:
-                    return json.load(f) or {}
-            except json.JSONDecodeError as e:
+                return _json_loads(self.metadata_file.read_bytes()) or {}
+            except ValueError as e:
+                # orjson.JSONDecodeError和json.JSONDecodeError都是ValueError子类
                 print(f"警告：解析现有元数据文件失败 - {e}")
                 return {}
             except Exception as e:
@@ -112,13 +133,8 @@ class MetadataUpdater:
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(self.metadata_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    metadata,
-                    f,
-                    indent=2,
-                    ensure_ascii=False
-                )
+            # 预编码的字节一次write写入
+            self.metadata_file.write_bytes(_json_dumps(metadata))
             print(f"元数据已成功更新到: {self.metadata_file}")
         except Exception as e:
             print(f"保存元数据文件失败: {e}")
@@ -173,7 +189,7 @@ class MetadataUpdater:
         """
         try:
             # 添加元数据文件到暂存区
-            self.run_git_command(["add", str(self.metadata_file)])
+            self.run_git_command(["add", self._metadata_str])
 
             # 创建提交
             self.run_git_command(["commit", "-m", message])